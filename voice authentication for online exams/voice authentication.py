@@ -7,15 +7,102 @@ import numpy as np
 import librosa
 import sounddevice as sd
 import soundfile as sf
-from scipy.io.wavfile import write
-import pickle
+from scipy.fftpack import dct
+from scipy.ndimage import convolve1d
 import os
+import hashlib
+import math
+import functools
+import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from sklearn.mixture import GaussianMixture
-from sklearn.preprocessing import StandardScaler
 import warnings
 warnings.filterwarnings('ignore')
 
+# Bump whenever the feature pipeline changes so stale cached features are not reused
+FEATURES_VERSION = 6
+
+# Frames quieter than this many dB below the peak are treated as silence
+VAD_TOP_DB = 25
+
+# Candidate GMM sizes for the BIC sweep run on the first registration
+GMM_COMPONENT_CANDIDATES = (4, 8, 12, 16)
+# Used only if the saved config has no size recorded
+DEFAULT_N_COMPONENTS = 8
+
+# Samples delivered per microphone callback
+STREAM_BLOCK_SIZE = 512
+
+# Frames scored per block in the GMM likelihood (keeps buffers in L2 cache)
+SCORE_BLOCK_SIZE = 128
+
+# Spectral analysis settings (32 ms frames with a 10 ms hop at 16 kHz)
+N_FFT = 512
+HOP_LENGTH = 160
+N_MELS = 40
+N_MFCC = 13
+
+# Savitzky-Golay delta kernels (width 5 for delta, its self-convolution for delta-delta)
+DELTA_KERNEL = np.array([2, 1, 0, -1, -2], dtype=np.float64) / 10
+DELTA2_KERNEL = np.convolve(DELTA_KERNEL, DELTA_KERNEL)
+
+
+def _precompute_diag_gmm(weights, means, covariances):
+    """Precompute the terms of a diagonal-covariance GMM log-likelihood"""
+    weights = np.asarray(weights, dtype=np.float64)
+    means = np.asarray(means, dtype=np.float64)
+    covariances = np.asarray(covariances, dtype=np.float64)
+    inv_var = 1.0 / covariances
+    params = {
+        'log_w': np.log(weights),
+        'inv_var': inv_var,
+        'means_inv_var': means * inv_var,
+        'log_det': np.sum(np.log(covariances), axis=1),
+        'means_sq_over_var': np.sum(means**2 * inv_var, axis=1),
+    }
+    return {name: value.astype(np.float32) for name, value in params.items()}
+
+
+def _score_diag_gmm(X, params, block_size=SCORE_BLOCK_SIZE):
+    """Average per-frame log-likelihood of X under a precomputed diagonal GMM"""
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    n_frames, n_features = X.shape
+    n_components = params['log_w'].shape[0]
+    
+    # Per-component terms that don't depend on the frame
+    const = params['log_w'] - 0.5 * (np.float32(n_features * np.log(2 * np.pi))
+                                      + params['log_det'] + params['means_sq_over_var'])
+    inv_var_t = np.ascontiguousarray(params['inv_var'].T)
+    means_inv_var_t = np.ascontiguousarray(2 * params['means_inv_var'].T)
+    
+    # Reused across blocks so the working set stays cache-resident
+    sq_buf = np.empty((block_size, n_features), dtype=np.float32)
+    log_prob_buf = np.empty((block_size, n_components), dtype=np.float32)
+    cross_buf = np.empty((block_size, n_components), dtype=np.float32)
+    
+    total = 0.0
+    for t0 in range(0, n_frames, block_size):
+        block = X[t0:t0 + block_size]
+        n = block.shape[0]
+        log_prob = log_prob_buf[:n]
+        np.square(block, out=sq_buf[:n])
+        np.matmul(sq_buf[:n], inv_var_t, out=log_prob)
+        np.matmul(block, means_inv_var_t, out=cross_buf[:n])
+        log_prob -= cross_buf[:n]
+        log_prob *= -0.5
+        log_prob += const
+        
+        # Stable log-sum-exp over components, done in place on the block buffer
+        m = log_prob.max(axis=1, keepdims=True)
+        np.subtract(log_prob, m, out=log_prob)
+        np.exp(log_prob, out=log_prob)
+        frame_scores = log_prob.sum(axis=1)
+        np.log(frame_scores, out=frame_scores)
+        total += (frame_scores + m.squeeze(axis=1)).sum()
+    return total / n_frames
+
 
 class VoiceAuthenticator:
     """Voice authentication system using GMM (Gaussian Mixture Models)"""
@@ -25,75 +112,163 @@ class VoiceAuthenticator:
         self.sample_rate = 16000
         self.duration = 5  # seconds
         
-        # Create directory for storing voice models
-        if not os.path.exists(self.models_dir):
-            os.makedirs(self.models_dir)
+        # Mel filter bank and DCT basis depend only on the fixed sample rate
+        self._mel_fb = librosa.filters.mel(sr=self.sample_rate, n_fft=N_FFT, n_mels=N_MELS).astype(np.float32)
+        self._dct = dct(np.eye(N_MELS), type=2, axis=0, norm='ortho')[:N_MFCC].astype(np.float32)
+        
+        self.features_cache_dir = os.path.join(self.models_dir, "features_cache")
+        self.config_path = os.path.join(self.models_dir, "gmm_config.json")
+        
+        # Per-instance memo of file extractions keyed by (path, mtime, size)
+        self._extract_file = functools.lru_cache(maxsize=64)(self._extract_file_uncached)
+        
+        # Create directories for storing voice models and cached features
+        if not os.path.exists(self.features_cache_dir):
+            os.makedirs(self.features_cache_dir)
     
     def extract_features(self, audio_path):
         """Extract MFCC features from audio file"""
+        # A modified file gets a new mtime/size and therefore a fresh extraction.
+        # Failures raise out of the cached call so they are never memoized.
         try:
-            # Load audio file
-            y, sr = librosa.load(audio_path, sr=self.sample_rate)
-            
-            # Extract MFCC features
-            mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-            mfcc_delta = librosa.feature.delta(mfcc)
-            mfcc_delta2 = librosa.feature.delta(mfcc, order=2)
-            
-            # Combine features
-            features = np.vstack([mfcc, mfcc_delta, mfcc_delta2])
-            features = features.T  # Transpose to get (time, features) shape
-            
-            return features
+            stat = os.stat(audio_path)
+            return self._extract_file(audio_path, stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             print(f"Error extracting features: {e}")
             return None
     
-    def record_audio(self, filename, duration=None):
-        """Record audio from microphone"""
+    def _extract_file_uncached(self, audio_path, mtime_ns, size):
+        # Load audio file (libsndfile returns float32 directly)
+        y, sr = sf.read(audio_path, dtype='float32')
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+        # Only resample files recorded elsewhere at a different rate
+        if sr != self.sample_rate:
+            y = librosa.resample(y, orig_sr=sr, target_sr=self.sample_rate)
+            sr = self.sample_rate
+        
+        # Reuse previously extracted features for identical audio files. Live
+        # microphone recordings never repeat, so they bypass this cache.
+        audio_hash = hashlib.blake2b(y.tobytes(), salt=str(FEATURES_VERSION).encode()).hexdigest()
+        cache_path = os.path.join(self.features_cache_dir, f"{audio_hash}.npy")
+        if os.path.exists(cache_path):
+            return np.load(cache_path)
+        
+        features = self._compute_features(y, sr)
+        np.save(cache_path, features)
+        return features
+    
+    def extract_features_from_array(self, y, sr):
+        """Extract MFCC features from an in-memory audio signal"""
+        try:
+            return self._compute_features(y, sr)
+        except Exception as e:
+            print(f"Error extracting features: {e}")
+            return None
+    
+    def _compute_features(self, y, sr):
+        # The mel filter bank is built for self.sample_rate
+        if sr != self.sample_rate:
+            y = librosa.resample(y, orig_sr=sr, target_sr=self.sample_rate)
+        
+        # Keep only the voiced regions so silence doesn't dilute the features
+        y, _ = librosa.effects.trim(y, top_db=VAD_TOP_DB)
+        intervals = librosa.effects.split(y, top_db=VAD_TOP_DB)
+        if len(intervals) > 0:
+            y = np.concatenate([y[start:end] for start, end in intervals])
+        
+        # Extract MFCC features from the real-input power spectrum
+        power_spec = np.abs(librosa.stft(y, n_fft=N_FFT, hop_length=HOP_LENGTH, window='hann'))**2
+        mfcc = self._dct @ np.log(self._mel_fb @ power_spec + 1e-10)
+        mfcc_delta = convolve1d(mfcc, DELTA_KERNEL, axis=1, mode='nearest')
+        mfcc_delta2 = convolve1d(mfcc, DELTA2_KERNEL, axis=1, mode='nearest')
+        
+        # Combine features into one C-contiguous (time, features) array
+        n_frames = mfcc.shape[1]
+        features = np.empty((n_frames, 3 * N_MFCC), dtype=np.float32)
+        features[:, 0:N_MFCC] = mfcc.T
+        features[:, N_MFCC:2 * N_MFCC] = mfcc_delta.T
+        features[:, 2 * N_MFCC:3 * N_MFCC] = mfcc_delta2.T
+        
+        return features
+    
+    def record_audio(self, filename=None, duration=None, save_to_disk=False):
+        """Record audio from microphone (None if it can't be read), optionally saving a WAV"""
         if duration is None:
             duration = self.duration
             
         print(f"Recording for {duration} seconds... Please speak clearly.")
         print("Say: 'My name is [Your Name] and I am taking this exam today.'")
         
-        # Record audio
-        recording = sd.rec(int(duration * self.sample_rate), 
-                          samplerate=self.sample_rate, 
-                          channels=1, 
-                          dtype='float32')
-        sd.wait()
+        n_samples = int(duration * self.sample_rate)
+        recording = np.empty(n_samples, dtype=np.float32)
+        blocks = queue.Queue()
+        stream_errors = []
         
-        # Save to file
-        write(filename, self.sample_rate, recording)
-        print(f"Recording saved to {filename}")
+        def callback(indata, frames, time_info, status):
+            # Runs on the audio thread: hand the block off without blocking
+            if status:
+                stream_errors.append(str(status))
+            blocks.put_nowait(indata[:, 0].copy())
         
-        return filename
+        # Stream audio into the buffer as it arrives
+        filled = 0
+        try:
+            with sd.InputStream(samplerate=self.sample_rate, channels=1, dtype='float32',
+                                blocksize=STREAM_BLOCK_SIZE, callback=callback):
+                while filled < n_samples:
+                    block = blocks.get(timeout=1.0)
+                    n = min(len(block), n_samples - filled)
+                    recording[filled:filled + n] = block[:n]
+                    filled += n
+        except queue.Empty:
+            print("Error: No audio received from the microphone. Please check your input device.")
+            return None, self.sample_rate
+        except sd.PortAudioError as e:
+            print(f"Error: Could not open the microphone: {e}")
+            return None, self.sample_rate
+        
+        if stream_errors:
+            # Input overflows drop samples, so the recording may contain gaps
+            print(f"⚠ Warning: Audio input problems during recording: {', '.join(sorted(set(stream_errors)))}")
+        
+        # Save to file for audit logging
+        if save_to_disk and filename is not None:
+            sf.write(filename, recording, self.sample_rate, subtype='FLOAT')
+            print(f"Recording saved to {filename}")
+        
+        return recording, self.sample_rate
     
-    def register_student(self, student_id, num_samples=3):
+    def register_student(self, student_id, num_samples=3, save=False):
         """Register a student's voice by recording multiple samples"""
         print(f"\n=== Voice Registration for Student ID: {student_id} ===")
         print("You will be asked to record your voice 3 times.")
         print("Please speak the same phrase each time for consistency.\n")
         
         all_features = []
-        
-        for i in range(num_samples):
-            print(f"\nRecording sample {i+1}/{num_samples}")
-            input("Press Enter when ready to record...")
-            
-            # Record audio
-            temp_file = f"temp_registration_{student_id}_{i}.wav"
-            self.record_audio(temp_file)
-            
-            # Extract features
-            features = self.extract_features(temp_file)
-            if features is not None:
-                all_features.append(features)
+        pending = None
+        
+        # Features of sample i are extracted on a background thread while
+        # sample i+1 is being recorded
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for i in range(num_samples):
+                print(f"\nRecording sample {i+1}/{num_samples}")
+                input("Press Enter when ready to record...")
+                
+                # Record audio
+                audit_file = f"registration_{student_id}_{i}.wav"
+                y, sr = self.record_audio(audit_file, save_to_disk=save)
+                if y is None:
+                    continue
+                
+                # Collect the previous sample before starting this one's extraction
+                if pending is not None:
+                    all_features.append(pending.result())
+                pending = executor.submit(self.extract_features_from_array, y, sr)
             
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            if pending is not None:
+                all_features.append(pending.result())
+        all_features = [features for features in all_features if features is not None]
         
         if len(all_features) == 0:
             print("Error: Could not extract features from recordings.")
@@ -102,73 +277,154 @@ class VoiceAuthenticator:
         # Combine all features
         combined_features = np.vstack(all_features)
         
-        # Normalize features
-        scaler = StandardScaler()
-        normalized_features = scaler.fit_transform(combined_features)
+        # Keep the raw features so the model can be retrained without re-recording
+        features_path = os.path.join(self.models_dir, f"{student_id}_features.npz")
+        np.savez(features_path, features=combined_features)
         
-        # Train GMM model
-        print("\nTraining voice model...")
-        gmm = GaussianMixture(n_components=16, covariance_type='diag', 
-                             max_iter=200, random_state=42)
-        gmm.fit(normalized_features)
+        return self.train_model(student_id, combined_features)
+    
+    def retrain_student(self, student_id):
+        """Retrain a student's voice model from the cached registration features"""
+        features_path = os.path.join(self.models_dir, f"{student_id}_features.npz")
+        
+        if not os.path.exists(features_path):
+            print(f"Error: No cached features found for Student ID: {student_id}")
+            print("Please register first.")
+            return False
         
-        # Save model and scaler
-        model_data = {
-            'gmm': gmm,
-            'scaler': scaler,
-            'student_id': student_id,
-            'registration_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
+        with np.load(features_path) as data:
+            combined_features = data['features']
         
-        model_path = os.path.join(self.models_dir, f"{student_id}_voice_model.pkl")
-        with open(model_path, 'wb') as f:
-            pickle.dump(model_data, f)
+        return self.train_model(student_id, combined_features)
+    
+    def select_n_components(self, normalized_features):
+        """Choose the GMM size by BIC once; returns (n_components, fitted winner or None)"""
+        if os.path.exists(self.config_path):
+            with open(self.config_path) as f:
+                return json.load(f).get('n_components', DEFAULT_N_COMPONENTS), None
+        
+        print("\nSelecting voice model size...")
+        best_gmm, best_bic = None, np.inf
+        for n_components in GMM_COMPONENT_CANDIDATES:
+            candidate = GaussianMixture(n_components=n_components, covariance_type='diag',
+                                        max_iter=200, tol=1e-3, reg_covar=1e-4,
+                                        random_state=42)
+            candidate.fit(normalized_features)
+            bic = candidate.bic(normalized_features)
+            if bic < best_bic:
+                best_gmm, best_bic = candidate, bic
+        
+        with open(self.config_path, 'w') as f:
+            json.dump({'n_components': best_gmm.n_components}, f)
+        return best_gmm.n_components, best_gmm
+    
+    def train_model(self, student_id, combined_features):
+        """Train and save a student's GMM voice model from extracted features"""
+        # Normalize features (kept in float32; StandardScaler would upcast to float64)
+        combined_features = combined_features.astype(np.float32)
+        scaler_mean = combined_features.mean(0, keepdims=True)
+        scaler_std = combined_features.std(0, keepdims=True) + 1e-8
+        normalized_features = ((combined_features - scaler_mean) / scaler_std).astype(np.float32)
+        
+        model_path = self._model_path(student_id)
+        prior = self.load_model(student_id)
+        
+        # The BIC sweep already fits the winning model with the training settings
+        n_components, gmm = self.select_n_components(normalized_features)
+        
+        # Train GMM model, starting EM from the previous model on re-registration
+        if gmm is None:
+            print("\nTraining voice model...")
+            if prior is not None and len(prior['w']) == n_components:
+                gmm = GaussianMixture(n_components=n_components, covariance_type='diag',
+                                     max_iter=50, tol=1e-3, reg_covar=1e-4,
+                                     warm_start=True, random_state=42,
+                                     means_init=np.asarray(prior['mu'], dtype=np.float64),
+                                     weights_init=np.asarray(prior['w'], dtype=np.float64),
+                                     precisions_init=1 / np.asarray(prior['var'], dtype=np.float64))
+            else:
+                gmm = GaussianMixture(n_components=n_components, covariance_type='diag',
+                                     max_iter=200, tol=1e-3, reg_covar=1e-4,
+                                     random_state=42)
+            gmm.fit(normalized_features)
+        
+        # Save only the arrays needed for scoring
+        np.savez(model_path,
+                 w=gmm.weights_.astype(np.float32),
+                 mu=gmm.means_.astype(np.float32),
+                 var=gmm.covariances_.astype(np.float32),
+                 scaler_mean=scaler_mean,
+                 scaler_std=scaler_std,
+                 student_id=np.array(student_id),
+                 registration_date=np.array(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
         
         print(f"\n✓ Voice model successfully created for Student ID: {student_id}")
         print(f"Model saved at: {model_path}")
         return True
     
-    def verify_student(self, student_id, threshold=-50):
+    def _model_path(self, student_id):
+        return os.path.join(self.models_dir, f"{student_id}_voice_model.npz")
+    
+    def load_model(self, student_id):
+        """Load a student's saved model arrays, or None if not registered"""
+        model_path = self._model_path(student_id)
+        if not os.path.exists(model_path):
+            return None
+        
+        with np.load(model_path) as data:
+            return {name: data[name] for name in data.files}
+    
+    def load_scoring_model(self, student_id):
+        """Load a student's model as (gmm_params, scaler_mean, scaler_std), or None"""
+        model_data = self.load_model(student_id)
+        if model_data is None:
+            return None
+        
+        gmm_params = _precompute_diag_gmm(model_data['w'], model_data['mu'], model_data['var'])
+        return gmm_params, model_data['scaler_mean'], model_data['scaler_std']
+    
+    def registered_student_ids(self):
+        """IDs of all students with a saved voice model"""
+        suffix = "_voice_model.npz"
+        return [name[:-len(suffix)] for name in os.listdir(self.models_dir)
+                if name.endswith(suffix)]
+    
+    def verify_student(self, student_id, threshold=-50, save=False, model=None):
         """Verify a student's identity during exam"""
         print(f"\n=== Voice Verification for Student ID: {student_id} ===")
         
-        # Load the student's voice model
-        model_path = os.path.join(self.models_dir, f"{student_id}_voice_model.pkl")
+        # Load the student's voice model unless the caller already holds it
+        if model is None:
+            model = self.load_scoring_model(student_id)
         
-        if not os.path.exists(model_path):
+        if model is None:
             print(f"Error: No voice model found for Student ID: {student_id}")
             print("Please register first.")
             return False
         
-        with open(model_path, 'rb') as f:
-            model_data = pickle.load(f)
-        
-        gmm = model_data['gmm']
-        scaler = model_data['scaler']
+        gmm_params, scaler_mean, scaler_std = model
         
         print("\nPlease speak for verification...")
         input("Press Enter when ready to record...")
         
         # Record verification audio
-        temp_file = f"temp_verification_{student_id}.wav"
-        self.record_audio(temp_file)
+        audit_file = f"verification_{student_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
+        y, sr = self.record_audio(audit_file, save_to_disk=save)
+        if y is None:
+            return False
         
         # Extract features
-        features = self.extract_features(temp_file)
-        
-        # Clean up temp file
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+        features = self.extract_features_from_array(y, sr)
         
         if features is None:
             print("Error: Could not extract features from recording.")
             return False
         
-        # Normalize features using saved scaler
-        normalized_features = scaler.transform(features)
+        # Normalize features using saved statistics
+        normalized_features = ((features - scaler_mean) / scaler_std).astype(np.float32)
         
         # Calculate likelihood score
-        score = gmm.score(normalized_features)
+        score = _score_diag_gmm(normalized_features, gmm_params)
         
         print(f"\nVerification Score: {score:.2f}")
         print(f"Threshold: {threshold}")
@@ -183,12 +439,18 @@ class VoiceAuthenticator:
             print(f"Voice does not match registered profile for Student ID {student_id}.")
             return False
     
-    def continuous_verification(self, student_id, num_checks=3, interval=300):
+    def continuous_verification(self, student_id, num_checks=3, interval=300, model=None):
         """Perform continuous verification during exam at intervals"""
         print(f"\n=== Continuous Verification Mode ===")
         print(f"Verification will be performed {num_checks} times during the exam.")
         
+        # Load the model once rather than on every check
+        if model is None:
+            model = self.load_scoring_model(student_id)
+        
         passed_checks = 0
+        checks_run = 0
+        required_checks = math.ceil(num_checks * 0.7)  # 70% threshold
         
         for i in range(num_checks):
             print(f"\n--- Verification Check {i+1}/{num_checks} ---")
@@ -198,17 +460,25 @@ class VoiceAuthenticator:
                 # In real scenario, you'd wait for 'interval' seconds
                 input("Press Enter to continue to next verification...")
             
-            result = self.verify_student(student_id)
+            result = self.verify_student(student_id, model=model)
+            checks_run += 1
             
             if result:
                 passed_checks += 1
             else:
                 print("\n⚠ Warning: Verification failed. Exam may be flagged.")
+            
+            # Stop once the remaining checks can no longer change the verdict
+            remaining = num_checks - checks_run
+            if passed_checks >= required_checks or passed_checks + remaining < required_checks:
+                if remaining > 0:
+                    print(f"\nOutcome decided; skipping {remaining} remaining check(s).")
+                break
         
         print(f"\n=== Verification Summary ===")
-        print(f"Passed: {passed_checks}/{num_checks} checks")
+        print(f"Passed: {passed_checks}/{checks_run} checks")
         
-        if passed_checks >= num_checks * 0.7:  # 70% threshold
+        if passed_checks >= required_checks:
             print("✓ Overall verification: PASSED")
             return True
         else:
@@ -222,6 +492,23 @@ class ExamSystem:
     def __init__(self):
         self.voice_auth = VoiceAuthenticator()
         self.registered_students = set()
+        self._model_cache = {}
+        
+        # Preload every registered student's model so verification skips disk I/O
+        for student_id in self.voice_auth.registered_student_ids():
+            model = self.voice_auth.load_scoring_model(student_id)
+            if model is not None:
+                self._model_cache[student_id] = model
+                self.registered_students.add(student_id)
+    
+    def _get_model(self, student_id):
+        """Return the cached scoring model for a student, loading it on first use"""
+        if student_id not in self._model_cache:
+            model = self.voice_auth.load_scoring_model(student_id)
+            if model is None:
+                return None
+            self._model_cache[student_id] = model
+        return self._model_cache[student_id]
     
     def register_for_exam(self, student_id):
         """Register student for exam with voice authentication"""
@@ -233,6 +520,8 @@ class ExamSystem:
         
         if success:
             self.registered_students.add(student_id)
+            # Replace any model cached from a previous registration
+            self._model_cache.pop(student_id, None)
             print(f"\n✓ Student {student_id} successfully registered for exam!")
         else:
             print(f"\n✗ Registration failed for Student {student_id}")
@@ -246,7 +535,7 @@ class ExamSystem:
         print("="*60)
         
         # Verify student before starting exam
-        verified = self.voice_auth.verify_student(student_id)
+        verified = self.voice_auth.verify_student(student_id, model=self._get_model(student_id))
         
         if verified:
             print("\n✓ You may now begin the exam.")
@@ -271,7 +560,8 @@ class ExamSystem:
         print("\nYou will be prompted for voice verification at intervals.")
         
         # Perform continuous verification
-        result = self.voice_auth.continuous_verification(student_id, num_checks=2)
+        result = self.voice_auth.continuous_verification(student_id, num_checks=2,
+                                                         model=self._get_model(student_id))
         
         if result:
             print("\n✓ Exam completed successfully with valid authentication.")